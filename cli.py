@@ -1,16 +1,23 @@
 #!/usr/bin/env python3
 """MacroPad CLI - Configure Chinese macro keypads from command line."""
 
+from __future__ import annotations
+
 import argparse
 import sys
 import logging
-from typing import List
+import re
+from functools import lru_cache, wraps
+
+# False at runtime; type checkers treat TYPE_CHECKING as True.
+# Keeps typing and the models off the import path
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from macropad.models import KeySequence
 
-from macropad.device import MacroPadDevice
-from macropad.models import (
-    InputAction, KeyCode, Modifier, MediaKey, MouseButton,
-    LedMode, KeySequence
-)
+# Keystroke/part separators, swallowing surrounding whitespace
+_COMMA_RE = re.compile(r'\s*,\s*')
+_PLUS_RE = re.compile(r'\s*\+\s*')
 
 
 def setup_logging(verbose: bool = False):
@@ -22,8 +29,42 @@ def setup_logging(verbose: bool = False):
     )
 
 
+@lru_cache(maxsize=None)
+def _name_map(enum_cls):
+    """Return a name -> member dict for an enum, built once per enum."""
+    return dict(enum_cls.__members__)
+
+
+@lru_cache(maxsize=None)
+def _modifier_bits():
+    """Return a name -> raw int map of Modifier flags for bit accumulation."""
+    from macropad.models import Modifier
+
+    return {name: int(flag) for name, flag in Modifier.__members__.items()}
+
+
+@lru_cache(maxsize=None)
+def _key_map():
+    """Return the KeyCode name map, also accepting number keys without KEY_."""
+    from macropad.models import KeyCode
+
+    key_map = dict(_name_map(KeyCode))
+    for name, code in KeyCode.__members__.items():
+        if name.startswith('KEY_'):
+            key_map[name[4:]] = code
+    return key_map
+
+
+@lru_cache(maxsize=None)
+def _valid_names(enum_cls):
+    """Return the comma-separated member names of an enum for error messages."""
+    return ', '.join(enum_cls.__members__)
+
+
 def list_devices(args):
     """List all available MacroPad devices."""
+    from macropad.device import MacroPadDevice
+
     devices = MacroPadDevice.list_devices()
 
     if not devices:
@@ -40,7 +81,7 @@ def list_devices(args):
     return 0
 
 
-def parse_key_sequence(key_str: str) -> List[KeySequence]:
+def parse_key_sequence(key_str: str) -> list[KeySequence]:
     """
     Parse a key sequence string into KeySequence list.
 
@@ -52,52 +93,77 @@ def parse_key_sequence(key_str: str) -> List[KeySequence]:
     Returns:
         List of KeySequence tuples
     """
+    from macropad.models import KeyCode, Modifier, KeySequence
+
+    modifier_bits = _modifier_bits()
+    key_map = _key_map()
     sequences = []
 
     # Split by comma for multiple keystrokes
-    keystrokes = key_str.upper().split(',')
+    keystrokes = _COMMA_RE.split(key_str.strip().upper())
 
     for keystroke in keystrokes:
-        parts = keystroke.strip().split('+')
+        parts = _PLUS_RE.split(keystroke)
 
-        modifiers = Modifier.NONE
+        # Accumulate as a plain int; Modifier's own | is costly
+        modifiers = 0
         key = KeyCode.NONE
 
         for part in parts:
-            part = part.strip()
-
             # Check if it's a modifier
-            if hasattr(Modifier, part):
-                modifiers |= getattr(Modifier, part)
-            # Check if it's a key
-            elif hasattr(KeyCode, part):
-                key = getattr(KeyCode, part)
-            # Check for KEY_ prefix (for numbers)
-            elif hasattr(KeyCode, f'KEY_{part}'):
-                key = getattr(KeyCode, f'KEY_{part}')
-            else:
+            bits = modifier_bits.get(part)
+            if bits is not None:
+                modifiers |= bits
+                continue
+
+            # Check if it's a key (KEY_ prefix optional for numbers)
+            code = key_map.get(part)
+            if code is None:
                 raise ValueError(f"Unknown key: {part}")
+            key = code
 
-        sequences.append(KeySequence(key, modifiers))
+        sequences.append(KeySequence(key, Modifier(modifiers)))
 
     return sequences
 
 
-def set_key_cmd(args):
-    """Configure a button/knob with keyboard keys."""
-    device = MacroPadDevice()
+def with_device(fn):
+    """Connect to the device and pass it to the wrapped command."""
+    @wraps(fn)
+    def wrapper(args):
+        from macropad.device import MacroPadDevice
 
-    if not device.connect():
-        print("Error: Could not connect to device")
-        return 1
+        device = MacroPadDevice()
 
-    try:
-        action = getattr(InputAction, args.action.upper())
-    except AttributeError:
-        print(f"Error: Invalid action '{args.action}'")
-        print(f"Valid actions: {', '.join(a.name for a in InputAction)}")
-        return 1
+        if not device.connect():
+            print("Error: Could not connect to device")
+            return 1
+
+        return fn(args, device)
+
+    return wrapper
+
+
+def with_device_action(fn):
+    """Connect to the device and parse ``args.action`` for the wrapped command."""
+    @wraps(fn)
+    def wrapper(args, device):
+        from macropad.models import InputAction
+
+        action = _name_map(InputAction).get(args.action.upper())
+        if action is None:
+            print(f"Error: Invalid action '{args.action}'")
+            print(f"Valid actions: {_valid_names(InputAction)}")
+            return 1
+
+        return fn(args, device, action)
 
+    return with_device(wrapper)
+
+
+@with_device_action
+def set_key_cmd(args, device, action):
+    """Configure a button/knob with keyboard keys."""
     try:
         sequence = parse_key_sequence(args.keys)
     except ValueError as e:
@@ -112,25 +178,15 @@ def set_key_cmd(args):
         return 1
 
 
-def set_media_cmd(args):
+@with_device_action
+def set_media_cmd(args, device, action):
     """Configure a button/knob with a media key."""
-    device = MacroPadDevice()
-
-    if not device.connect():
-        print("Error: Could not connect to device")
-        return 1
-
-    try:
-        action = getattr(InputAction, args.action.upper())
-    except AttributeError:
-        print(f"Error: Invalid action '{args.action}'")
-        return 1
+    from macropad.models import MediaKey
 
-    try:
-        media_key = getattr(MediaKey, args.media_key.upper())
-    except AttributeError:
+    media_key = _name_map(MediaKey).get(args.media_key.upper())
+    if media_key is None:
         print(f"Error: Invalid media key '{args.media_key}'")
-        print(f"Valid media keys: {', '.join(m.name for m in MediaKey)}")
+        print(f"Valid media keys: {_valid_names(MediaKey)}")
         return 1
 
     if device.set_media_key(action, media_key):
@@ -141,38 +197,29 @@ def set_media_cmd(args):
         return 1
 
 
-def set_mouse_cmd(args):
+@with_device_action
+def set_mouse_cmd(args, device, action):
     """Configure a button/knob with a mouse button."""
-    device = MacroPadDevice()
-
-    if not device.connect():
-        print("Error: Could not connect to device")
-        return 1
-
-    try:
-        action = getattr(InputAction, args.action.upper())
-    except AttributeError:
-        print(f"Error: Invalid action '{args.action}'")
-        return 1
+    from macropad.models import Modifier, MouseButton
 
-    try:
-        mouse_button = getattr(MouseButton, args.button.upper())
-    except AttributeError:
+    mouse_button = _name_map(MouseButton).get(args.button.upper())
+    if mouse_button is None:
         print(f"Error: Invalid mouse button '{args.button}'")
-        print(f"Valid buttons: {', '.join(b.name for b in MouseButton)}")
+        print(f"Valid buttons: {_valid_names(MouseButton)}")
         return 1
 
     # Parse modifiers if provided
-    modifiers = Modifier.NONE
+    modifiers = 0
     if args.modifiers:
+        modifier_bits = _modifier_bits()
         for mod in args.modifiers.upper().split('+'):
-            try:
-                modifiers |= getattr(Modifier, mod.strip())
-            except AttributeError:
+            bits = modifier_bits.get(mod.strip())
+            if bits is None:
                 print(f"Error: Invalid modifier '{mod}'")
                 return 1
+            modifiers |= bits
 
-    if device.set_mouse_button(action, mouse_button, modifiers):
+    if device.set_mouse_button(action, mouse_button, Modifier(modifiers)):
         print(f"Successfully configured {action.name} with {mouse_button.name}")
         return 0
     else:
@@ -180,19 +227,15 @@ def set_mouse_cmd(args):
         return 1
 
 
-def set_led_cmd(args):
+@with_device
+def set_led_cmd(args, device):
     """Configure LED mode."""
-    device = MacroPadDevice()
+    from macropad.models import LedMode
 
-    if not device.connect():
-        print("Error: Could not connect to device")
-        return 1
-
-    try:
-        led_mode = getattr(LedMode, args.mode.upper())
-    except AttributeError:
+    led_mode = _name_map(LedMode).get(args.mode.upper())
+    if led_mode is None:
         print(f"Error: Invalid LED mode '{args.mode}'")
-        print(f"Valid modes: {', '.join(m.name for m in LedMode)}")
+        print(f"Valid modes: {_valid_names(LedMode)}")
         return 1
 
     if device.set_led_mode(led_mode):
@@ -203,6 +246,54 @@ def set_led_cmd(args):
         return 1
 
 
+def _sniff_subcommand(argv):
+    """Return the first positional argument (the subcommand name), if any."""
+    return next((a for a in argv[1:] if not a.startswith('-')), None)
+
+
+def _add_list_parser(subparsers):
+    list_parser = subparsers.add_parser('list', help='List available devices')
+    list_parser.set_defaults(func=list_devices)
+
+
+def _add_key_parser(subparsers):
+    key_parser = subparsers.add_parser('set-key', help='Configure keyboard keys')
+    key_parser.add_argument('action', help='Button/knob action (e.g., button_1, knob_1_cw)')
+    key_parser.add_argument('keys', help='Key sequence (e.g., "LCTRL+A,ENTER")')
+    key_parser.set_defaults(func=set_key_cmd)
+
+
+def _add_media_parser(subparsers):
+    media_parser = subparsers.add_parser('set-media', help='Configure media key')
+    media_parser.add_argument('action', help='Button/knob action')
+    media_parser.add_argument('media_key', help='Media key (e.g., play_pause, volume_up)')
+    media_parser.set_defaults(func=set_media_cmd)
+
+
+def _add_mouse_parser(subparsers):
+    mouse_parser = subparsers.add_parser('set-mouse', help='Configure mouse button')
+    mouse_parser.add_argument('action', help='Button/knob action')
+    mouse_parser.add_argument('button', help='Mouse button (left, right, middle, scroll_up, scroll_down)')
+    mouse_parser.add_argument('-m', '--modifiers', help='Modifier keys (e.g., "LCTRL+LSHIFT")')
+    mouse_parser.set_defaults(func=set_mouse_cmd)
+
+
+def _add_led_parser(subparsers):
+    led_parser = subparsers.add_parser('set-led', help='Configure LED mode')
+    led_parser.add_argument('mode', help='LED mode (off, on, breathe)')
+    led_parser.set_defaults(func=set_led_cmd)
+
+
+# Subcommand name -> function registering its parser
+_SUBCOMMANDS = {
+    'list': _add_list_parser,
+    'set-key': _add_key_parser,
+    'set-media': _add_media_parser,
+    'set-mouse': _add_mouse_parser,
+    'set-led': _add_led_parser,
+}
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -239,33 +330,18 @@ Actions for 3-button 1-knob device:
 
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
 
-    # List command
-    list_parser = subparsers.add_parser('list', help='List available devices')
-    list_parser.set_defaults(func=list_devices)
-
-    # Set-key command
-    key_parser = subparsers.add_parser('set-key', help='Configure keyboard keys')
-    key_parser.add_argument('action', help='Button/knob action (e.g., button_1, knob_1_cw)')
-    key_parser.add_argument('keys', help='Key sequence (e.g., "LCTRL+A,ENTER")')
-    key_parser.set_defaults(func=set_key_cmd)
-
-    # Set-media command
-    media_parser = subparsers.add_parser('set-media', help='Configure media key')
-    media_parser.add_argument('action', help='Button/knob action')
-    media_parser.add_argument('media_key', help='Media key (e.g., play_pause, volume_up)')
-    media_parser.set_defaults(func=set_media_cmd)
-
-    # Set-mouse command
-    mouse_parser = subparsers.add_parser('set-mouse', help='Configure mouse button')
-    mouse_parser.add_argument('action', help='Button/knob action')
-    mouse_parser.add_argument('button', help='Mouse button (left, right, middle, scroll_up, scroll_down)')
-    mouse_parser.add_argument('-m', '--modifiers', help='Modifier keys (e.g., "LCTRL+LSHIFT")')
-    mouse_parser.set_defaults(func=set_mouse_cmd)
+    # Spell out the usage line (set after add_subparsers, which derives the
+    # subcommand prog from it) so it lists every command even when only
+    # the invoked one is built below
+    parser.usage = f"%(prog)s [-h] [-v] {{{','.join(_SUBCOMMANDS)}}} ..."
 
-    # Set-LED command
-    led_parser = subparsers.add_parser('set-led', help='Configure LED mode')
-    led_parser.add_argument('mode', help='LED mode (off, on, breathe)')
-    led_parser.set_defaults(func=set_led_cmd)
+    # Only build the invoked subcommand; build all of them for help/unknown
+    sub = _sniff_subcommand(sys.argv)
+    if sub in _SUBCOMMANDS:
+        _SUBCOMMANDS[sub](subparsers)
+    else:
+        for add_parser in _SUBCOMMANDS.values():
+            add_parser(subparsers)
 
     args = parser.parse_args()
 
@@ -1,8 +1,8 @@
 """High-level MacroPad device interface."""
 
-from typing import List, Optional
+from __future__ import annotations
 from .hid_interface import HidInterface
-from .protocol import LegacyProtocol, Report
+from .protocol import LegacyProtocol, ReportBatch
 from .models import (
     InputAction, KeyCode, Modifier, MediaKey, MouseButton,
     LedMode, KeySequence
@@ -17,9 +17,10 @@ class MacroPadDevice:
 
     def __init__(self):
         self.hid = HidInterface()
-        self.protocol: Optional[LegacyProtocol] = None
+        self.protocol: LegacyProtocol | None = None
+        self._protocol_ready = False
 
-    def connect(self, vendor_id: Optional[int] = None, product_id: Optional[int] = None) -> bool:
+    def connect(self, vendor_id: int | None = None, product_id: int | None = None) -> bool:
         """
         Connect to a MacroPad device.
 
@@ -35,6 +36,7 @@ class MacroPadDevice:
 
             if protocol_version == 0:
                 self.protocol = LegacyProtocol(report_id=0)
+                self._protocol_ready = True
                 logger.info("Using Legacy Protocol (version 0)")
             elif protocol_version == 1:
                 logger.error("Extended protocol not yet implemented")
@@ -53,25 +55,34 @@ class MacroPadDevice:
         """Disconnect from device."""
         self.hid.close()
         self.protocol = None
+        self._protocol_ready = False
 
-    def _send_reports(self, reports: List[Report]) -> bool:
-        """Send a list of reports to the device."""
+    def _send_reports(self, reports: ReportBatch) -> bool:
+        """Send a batch of reports to the device."""
         if not self.hid.is_open():
             logger.error("Device not connected")
             return False
 
-        for report in reports:
-            logger.debug(f"Sending: {report}")
-            if not self.hid.write_report(report.report_id, bytes(report.data)):
-                logger.error("Failed to send report")
-                return False
+        # The batch buffer goes back to the pool afterwards, so log an owned
+        # copy of each frame rather than a view a late handler could misread
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        try:
+            for report in reports:
+                if debug:
+                    logger.debug("Sending: %s", repr(report))
+                if not self.hid.write_frame(report.frame):
+                    logger.error("Failed to send report")
+                    return False
+        finally:
+            reports.release()
 
         return True
 
     def set_key_sequence(
         self,
         action: InputAction,
-        sequence: List[KeySequence],
+        sequence: list[KeySequence],
         layer: int = 0
     ) -> bool:
         """
@@ -85,7 +96,7 @@ class MacroPadDevice:
         Returns:
             True if successful
         """
-        if not isinstance(self.protocol, LegacyProtocol):
+        if not self._protocol_ready:
             logger.error("Protocol not initialized")
             return False
 
@@ -118,7 +129,7 @@ class MacroPadDevice:
         Returns:
             True if successful
         """
-        if not isinstance(self.protocol, LegacyProtocol):
+        if not self._protocol_ready:
             logger.error("Protocol not initialized")
             return False
 
@@ -149,7 +160,7 @@ class MacroPadDevice:
         Returns:
             True if successful
         """
-        if not isinstance(self.protocol, LegacyProtocol):
+        if not self._protocol_ready:
             logger.error("Protocol not initialized")
             return False
 
@@ -172,7 +183,7 @@ class MacroPadDevice:
         Returns:
             True if successful
         """
-        if not isinstance(self.protocol, LegacyProtocol):
+        if not self._protocol_ready:
             logger.error("Protocol not initialized")
             return False
 
@@ -192,6 +203,6 @@ class MacroPadDevice:
         return self.hid.is_open()
 
     @staticmethod
-    def list_devices() -> List[dict]:
+    def list_devices() -> list[dict]:
         """List all available MacroPad devices."""
         return HidInterface.list_devices()
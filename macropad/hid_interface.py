@@ -1,39 +1,94 @@
 """HID communication interface for MacroPad devices."""
 
-import hid
-from typing import Optional, List
+from __future__ import annotations
+
+from functools import lru_cache
 import logging
 
+# False at runtime; type checkers treat TYPE_CHECKING as True.
+# hid itself is imported lazily where it is used
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import hid
+
 logger = logging.getLogger(__name__)
 
 
 class DeviceConfig:
     """Configuration for a specific MacroPad device."""
 
+    __slots__ = ('vendor_id', 'product_id', 'path_fragment', 'protocol_version', '_fragment_upper')
+
     def __init__(self, vendor_id: int, product_id: int, path_fragment: str, protocol_version: int):
         self.vendor_id = vendor_id
         self.product_id = product_id
         self.path_fragment = path_fragment
         self.protocol_version = protocol_version
 
+        # Upper-cased once for case-insensitive path matching
+        if isinstance(path_fragment, bytes):
+            self._fragment_upper = path_fragment.decode('utf-8', errors='ignore').upper()
+        else:
+            self._fragment_upper = str(path_fragment).upper()
+
+
+@lru_cache(maxsize=1)
+def _enumerate() -> tuple:
+    """
+    Enumerate all HID devices, memoized between a listing and a search.
+
+    list_devices() always enumerates afresh, so only a search right after
+    a listing (or a repeated search) reuses the snapshot; a search that
+    cannot open anything from a reused snapshot enumerates again.
+    """
+    import hid
+
+    return tuple(hid.enumerate())
+
 
 # Default configurations for known devices
-KNOWN_DEVICES = [
+KNOWN_DEVICES = (
     DeviceConfig(0x1189, 0x8860, "MI_01", 1),  # 4489:34880
     DeviceConfig(0x1189, 0x8890, "MI_01", 0),  # 4489:34960 - 3 buttons 1 knob
     DeviceConfig(0x1189, 0x8830, "MI_00", 1),  # 4489:34864
-]
+)
+
+# Known device configs indexed by (vendor_id, product_id)
+_KNOWN_BY_VIDPID = {(c.vendor_id, c.product_id): c for c in KNOWN_DEVICES}
+
+
+def _iter_matching(configs: dict):
+    """
+    Yield (device_info, config) for each HID device matching a config.
+
+    Args:
+        configs: DeviceConfig objects keyed by (vendor_id, product_id)
+    """
+    for device_info in _enumerate():
+        config = configs.get((device_info['vendor_id'], device_info['product_id']))
+        if config is None:
+            continue
+
+        path = device_info['path']
+        if isinstance(path, bytes):
+            path_str = path.decode('utf-8', errors='ignore')
+        else:
+            path_str = str(path)
+
+        # Case-insensitive search for Windows/Linux compatibility
+        if config._fragment_upper in path_str.upper():
+            yield device_info, config
 
 
 class HidInterface:
     """Handles HID communication with MacroPad devices."""
 
     def __init__(self):
-        self.device: Optional[hid.device] = None
-        self.config: Optional[DeviceConfig] = None
+        self.device: hid.device | None = None
+        self.config: DeviceConfig | None = None
         self.output_report_length = 65  # Standard HID report size
 
-    def find_device(self, vendor_id: Optional[int] = None, product_id: Optional[int] = None) -> bool:
+    def find_device(self, vendor_id: int | None = None, product_id: int | None = None) -> bool:
         """
         Find and connect to a MacroPad device.
 
@@ -44,60 +99,54 @@ class HidInterface:
         Returns:
             True if device found and opened successfully
         """
-        devices_to_search = KNOWN_DEVICES
+        configs = _KNOWN_BY_VIDPID
 
         if vendor_id and product_id:
             # Search for specific device
-            devices_to_search = [d for d in KNOWN_DEVICES
-                               if d.vendor_id == vendor_id and d.product_id == product_id]
-            if not devices_to_search:
+            config = _KNOWN_BY_VIDPID.get((vendor_id, product_id))
+            if config is None:
                 # Create config for unknown device, assume protocol 0
-                devices_to_search = [DeviceConfig(vendor_id, product_id, b"mi_", 0)]
-
-        for config in devices_to_search:
-            logger.debug(f"Searching for device {config.vendor_id:04X}:{config.product_id:04X}")
-
-            # Enumerate all HID devices
-            for device_info in hid.enumerate(config.vendor_id, config.product_id):
-                path = device_info['path']
-
-                # Check if path contains the required fragment
-                # Convert both to strings for comparison (case-insensitive)
-                try:
-                    if isinstance(path, bytes):
-                        path_str = path.decode('utf-8', errors='ignore')
-                    else:
-                        path_str = str(path)
-
-                    if isinstance(config.path_fragment, bytes):
-                        fragment_str = config.path_fragment.decode('utf-8', errors='ignore')
-                    else:
-                        fragment_str = str(config.path_fragment)
-
-                    # Case-insensitive search for Windows/Linux compatibility
-                    if fragment_str.upper() not in path_str.upper():
-                        continue
-                except Exception as e:
-                    logger.debug(f"Path check failed: {e}")
-                    continue
-
-                try:
-                    self.device = hid.device()
-                    self.device.open_path(path)
-                    self.config = config
-
-                    manufacturer = self.device.get_manufacturer_string()
-                    product = self.device.get_product_string()
-                    logger.info(f"Connected to: {manufacturer} {product}")
-                    logger.info(f"VID:PID = {config.vendor_id:04X}:{config.product_id:04X}")
-                    logger.info(f"Protocol version: {config.protocol_version}")
-
-                    return True
-                except Exception as e:
-                    logger.error(f"Failed to open device: {e}")
-                    continue
+                config = DeviceConfig(vendor_id, product_id, b"mi_", 0)
+            configs = {(vendor_id, product_id): config}
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Searching for devices %s",
+                         ', '.join(f"{vid:04X}:{pid:04X}" for vid, pid in configs))
+
+        reused = _enumerate.cache_info().currsize > 0
+        if self._open_first(configs):
+            return True
+
+        # A reused snapshot may predate a hot-plug or re-plug (stale path)
+        _enumerate.cache_clear()
+        if reused and self._open_first(configs):
+            return True
 
         logger.error("No compatible MacroPad device found")
+        _enumerate.cache_clear()
+        return False
+
+    def _open_first(self, configs: dict) -> bool:
+        """Open the first enumerated device matching one of ``configs``."""
+        import hid
+
+        for device_info, config in _iter_matching(configs):
+            try:
+                self.device = hid.device()
+                self.device.open_path(device_info['path'])
+                self.config = config
+
+                manufacturer = self.device.get_manufacturer_string()
+                product = self.device.get_product_string()
+                logger.info(f"Connected to: {manufacturer} {product}")
+                logger.info(f"VID:PID = {config.vendor_id:04X}:{config.product_id:04X}")
+                logger.info(f"Protocol version: {config.protocol_version}")
+
+                return True
+            except Exception as e:
+                logger.error(f"Failed to open device: {e}")
+                continue
+
         return False
 
     def close(self):
@@ -108,6 +157,8 @@ class HidInterface:
             self.config = None
             logger.info("Device closed")
 
+        _enumerate.cache_clear()
+
     def write_report(self, report_id: int, data: bytes) -> bool:
         """
         Write a HID report to the device.
@@ -116,6 +167,26 @@ class HidInterface:
             report_id: HID report ID
             data: Report data (should be 64 bytes)
 
+        Returns:
+            True if write successful
+        """
+        # Prepare buffer: [report_id][data], data truncated/zero-padded to 64 bytes
+        # (slice assignment accepts any buffer or sequence of ints)
+        payload = bytearray(self.output_report_length)
+        payload[0] = report_id
+        data = data[:self.output_report_length - 1]
+        payload[1:1 + len(data)] = data
+
+        return self.write_frame(payload)
+
+    def write_frame(self, frame) -> bool:
+        """
+        Write a complete [report_id][data] frame to the device as-is.
+
+        Args:
+            frame: Bytes-like object of output_report_length bytes
+                   (e.g. a memoryview into a report batch)
+
         Returns:
             True if write successful
         """
@@ -123,17 +194,9 @@ class HidInterface:
             logger.error("Device not opened")
             return False
 
-        # Prepare buffer: [report_id][data]
-        buffer = bytearray(self.output_report_length)
-        buffer[0] = report_id
-
-        # Copy data (max 64 bytes)
-        data_len = min(len(data), 64)
-        buffer[1:data_len+1] = data[:data_len]
-
         try:
-            bytes_written = self.device.write(bytes(buffer))
-            logger.debug(f"Wrote {bytes_written} bytes to device")
+            bytes_written = self.device.write(frame)
+            logger.debug("Wrote %d bytes to device", bytes_written)
             # On Windows, write() returns -1 on success for some devices
             # On Linux, it returns the number of bytes written
             # Consider both as success if no exception was raised
@@ -151,38 +214,21 @@ class HidInterface:
         return self.device is not None
 
     @staticmethod
-    def list_devices() -> List[dict]:
+    def list_devices() -> list[dict]:
         """List all potential MacroPad devices."""
+        # Always list what is plugged in now; a search right after reuses it
+        _enumerate.cache_clear()
+
         found_devices = []
 
-        for config in KNOWN_DEVICES:
-            for device_info in hid.enumerate(config.vendor_id, config.product_id):
-                path = device_info['path']
-
-                # Check path fragment (cross-platform, case-insensitive)
-                try:
-                    if isinstance(path, bytes):
-                        path_str = path.decode('utf-8', errors='ignore')
-                    else:
-                        path_str = str(path)
-
-                    if isinstance(config.path_fragment, bytes):
-                        fragment_str = config.path_fragment.decode('utf-8', errors='ignore')
-                    else:
-                        fragment_str = str(config.path_fragment)
-
-                    if fragment_str.upper() not in path_str.upper():
-                        continue
-                except:
-                    continue
-
-                found_devices.append({
-                    'vendor_id': device_info['vendor_id'],
-                    'product_id': device_info['product_id'],
-                    'manufacturer': device_info['manufacturer_string'],
-                    'product': device_info['product_string'],
-                    'path': device_info['path'],
-                    'protocol': config.protocol_version
-                })
+        for device_info, config in _iter_matching(_KNOWN_BY_VIDPID):
+            found_devices.append({
+                'vendor_id': device_info['vendor_id'],
+                'product_id': device_info['product_id'],
+                'manufacturer': device_info['manufacturer_string'],
+                'product': device_info['product_string'],
+                'path': device_info['path'],
+                'protocol': config.protocol_version
+            })
 
         return found_devices
@@ -1,7 +1,7 @@
 """Data models and enums for MacroPad protocol."""
 
+from collections import namedtuple
 from enum import IntEnum, IntFlag
-from typing import NamedTuple
 
 
 class Modifier(IntFlag):
@@ -154,7 +154,5 @@ class LedMode(IntEnum):
     BREATHE = 2
 
 
-class KeySequence(NamedTuple):
-    """A single keystroke with modifiers."""
-    key: KeyCode
-    modifiers: Modifier
+KeySequence = namedtuple('KeySequence', ('key', 'modifiers'))
+KeySequence.__doc__ = """A single keystroke with modifiers (key: KeyCode, modifiers: Modifier)."""
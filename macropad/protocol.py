@@ -1,26 +1,187 @@
 """Protocol implementation for MacroPad communication."""
 
-from typing import List, Tuple
+from __future__ import annotations
 from .models import (
     InputAction, KeyCode, Modifier, MediaKey, MouseButton,
     LedMode, KeyType, KeySequence
 )
+from functools import lru_cache
+from collections.abc import Iterator
 import logging
+import struct
+import threading
 
 logger = logging.getLogger(__name__)
 
+REPORT_SIZE = 64  # Data bytes per HID report
+FRAME_SIZE = REPORT_SIZE + 1  # [report_id][data]
+
+# Key report data bytes 0-5: action, type, sequence length, index, modifiers, key
+_KEY_HEADER = struct.Struct('<6B')
+
+# Function report data bytes 0-4: action, type, then three function bytes
+_FUNCTION_HEADER = struct.Struct('<5B')
+
+# Key types as plain ints for the report builders
+_KT_BASIC = int(KeyType.BASIC)
+_KT_MULTI = int(KeyType.MULTIMEDIA)
+
+# Type byte (key type in the low nibble, layer in the high nibble),
+# indexed by [key type][layer & 0x0F]
+_TYPE_BYTE_LUT = tuple(
+    bytes(key_type | (layer << 4) for layer in range(16))
+    for key_type in range(max(KeyType) + 1)
+)
+
+# Mouse buttons encoded in data byte 2; everything else is a scroll (byte 3)
+_MOUSE_CLICK_BUTTONS = frozenset((MouseButton.LEFT, MouseButton.RIGHT, MouseButton.MIDDLE))
+
+# Sequence sent when configuring an empty key sequence
+_EMPTY_SEQUENCE = (KeySequence(KeyCode.NONE, Modifier.NONE),)
+
+
+class _BufferPool:
+    """
+    Per-thread free list of zeroed batch buffers, keyed by size.
+
+    Only buffers up to ``max_size`` bytes are recycled; larger ones are
+    simply allocated and left to the garbage collector.
+    """
+
+    def __init__(self, max_size: int = FRAME_SIZE * 8, max_free: int = 4):
+        self.max_size = max_size
+        self.max_free = max_free
+        self._zeros = memoryview(bytes(max_size))
+        self._local = threading.local()
+
+    def _free_list(self, size: int) -> list:
+        free = getattr(self._local, 'free', None)
+        if free is None:
+            free = self._local.free = {}
+        return free.setdefault(size, [])
+
+    def acquire(self, size: int) -> bytearray:
+        """Return a zero-filled buffer of ``size`` bytes."""
+        if size <= self.max_size:
+            free = self._free_list(size)
+            if free:
+                buf = free.pop()
+                buf[:] = self._zeros[:size]
+                return buf
+        return bytearray(size)
+
+    def release(self, buf: bytearray):
+        """Return a buffer to the pool; it must not be used afterwards."""
+        size = len(buf)
+        if size <= self.max_size:
+            free = self._free_list(size)
+            if len(free) < self.max_free:
+                free.append(buf)
+
+
+_POOL = _BufferPool()
+
+
+def _byte_range_error() -> ValueError:
+    """
+    Return the ValueError a bytearray store raises for an out-of-range byte.
+
+    The '<6B'/'<5B' headers range-check every field but raise struct.error,
+    which is re-raised as this so callers see the same exception as before.
+    """
+    return ValueError("byte must be in range(0, 256)")
+
+
+@lru_cache(maxsize=64)
+def _layer_selection_frame(report_id: int, layer: int) -> bytes:
+    """Return the (immutable, shared) layer selection frame."""
+    frame = bytearray(FRAME_SIZE)
+    frame[0] = report_id
+    frame[1] = 0x01  # Layer selection command
+    frame[2] = layer
+    return bytes(frame)
+
+
+@lru_cache(maxsize=64)
+def _write_flash_frame(report_id: int, led: bool = False) -> bytes:
+    """Return the (immutable, shared) write flash frame."""
+    frame = bytearray(FRAME_SIZE)
+    frame[0] = report_id
+    frame[1] = 0xFE if led else 0xFF  # Write flash command
+    return bytes(frame)
+
 
 class Report:
-    """HID report to be sent to device."""
+    """View of a single HID report frame ([report_id][data]) inside a ReportBatch."""
 
-    def __init__(self, report_id: int = 0):
-        self.report_id = report_id
-        self.data = bytearray(64)
+    __slots__ = ('frame',)
+
+    def __init__(self, frame: memoryview):
+        self.frame = frame
+
+    @property
+    def report_id(self) -> int:
+        return self.frame[0]
+
+    @property
+    def data(self) -> memoryview:
+        return self.frame[1:]
 
     def __repr__(self):
         return f"Report(id={self.report_id}, data={self.data.hex()})"
 
 
+class ReportBatch:
+    """
+    Sequence of HID reports stored back to back in one buffer.
+
+    Each report occupies ``stride`` bytes: the report ID followed by
+    64 data bytes, i.e. exactly the frame written to the device.
+    """
+
+    __slots__ = ('buf', 'count', 'stride')
+
+    def __init__(self, count: int, report_id: int = 0):
+        self.count = count
+        self.stride = FRAME_SIZE
+        self.buf = _POOL.acquire(count * FRAME_SIZE)
+        if report_id:
+            self.buf[::FRAME_SIZE] = bytes((report_id,)) * count
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self) -> Iterator[Report]:
+        # Views are produced lazily, one per frame, as the caller writes them
+        view = memoryview(self.buf)
+        stride = self.stride
+        for base in range(0, self.count * stride, stride):
+            yield Report(view[base:base + stride])
+
+    def __getitem__(self, index: int) -> Report:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("report index out of range")
+
+        base = index * self.stride
+        return Report(memoryview(self.buf)[base:base + self.stride])
+
+    def __repr__(self):
+        return f"ReportBatch(count={self.count})"
+
+    def release(self):
+        """
+        Hand the buffer back to the pool once the reports have been sent.
+
+        The batch and any Report views taken from it must not be used
+        afterwards.
+        """
+        _POOL.release(self.buf)
+        self.buf = bytearray()
+        self.count = 0
+
+
 class LegacyProtocol:
     """
     Legacy protocol implementation for 3-button 1-knob devices.
@@ -29,30 +190,86 @@ class LegacyProtocol:
     1. Layer selection (if report_id != 0)
     2. Key function report(s)
     3. Write flash report
+
+    Reports are built into a single ReportBatch; ``base`` below is the
+    offset of a frame in the batch buffer, so data byte ``k`` of that
+    report lives at ``buf[base + 1 + k]``.
     """
 
     def __init__(self, report_id: int = 0):
         self.report_id = report_id
 
-    def create_layer_selection_report(self, layer: int) -> Report:
-        """Create layer selection report."""
-        report = Report(self.report_id)
-        report.data[0] = 0x01  # Layer selection command
-        report.data[1] = layer
-        return report
+        # report_id is fixed per instance, so pick the batch prologue once
+        # instead of branching on it in every create_*_reports call
+        self._begin = self._begin_layered if report_id != 0 else self._begin_unlayered
+
+    def _begin_unlayered(self, count: int, layer: int) -> tuple[ReportBatch, int, int]:
+        """
+        Allocate a batch for ``count`` function reports plus write flash.
+
+        Returns:
+            (batch, offset of the first function report, _TYPE_BYTE_LUT index)
+        """
+        return ReportBatch(count + 1), 0, 0
+
+    def _begin_layered(self, count: int, layer: int) -> tuple[ReportBatch, int, int]:
+        """Like _begin_unlayered, with a leading layer selection report."""
+        batch = ReportBatch(count + 2, self.report_id)
+        batch.buf[:FRAME_SIZE] = _layer_selection_frame(self.report_id, layer)
+        return batch, FRAME_SIZE, layer & 0x0F
+
+    def _create_function_reports(
+        self,
+        action: InputAction,
+        layer: int,
+        key_type: int,
+        b2: int,
+        b3: int,
+        b4: int = 0
+    ) -> ReportBatch:
+        """
+        Create a single function report followed by write flash.
+
+        Args:
+            action: Which button/knob action to configure
+            layer: Layer number
+            key_type: Key type for data byte 1
+            b2, b3, b4: Function-specific data bytes 2-4
+
+        Returns:
+            Batch of reports to send
+        """
+        # Layer selection (if needed) is filled in by _begin
+        batch, base, type_index = self._begin(1, layer)
+        buf = batch.buf
+
+        try:
+            _FUNCTION_HEADER.pack_into(
+                buf, base + 1, int(action), _TYPE_BYTE_LUT[key_type][type_index], b2, b3, b4
+            )
+        except struct.error:
+            batch.release()
+            raise _byte_range_error() from None
+
+        base += batch.stride
+        buf[base:base + FRAME_SIZE] = _write_flash_frame(self.report_id)
+
+        return batch
 
-    def create_write_flash_report(self, led: bool = False) -> Report:
-        """Create write flash report to save settings."""
-        report = Report(self.report_id)
-        report.data[0] = 0xFE if led else 0xFF  # Write flash command
-        return report
+    def create_layer_selection_report(self, layer: int) -> bytes:
+        """Create layer selection report as an immutable [report_id][data] frame."""
+        return _layer_selection_frame(self.report_id, layer)
+
+    def create_write_flash_report(self, led: bool = False) -> bytes:
+        """Create write flash report as an immutable [report_id][data] frame."""
+        return _write_flash_frame(self.report_id, led)
 
     def create_key_reports(
         self,
         action: InputAction,
         layer: int,
-        sequence: List[KeySequence]
-    ) -> List[Report]:
+        sequence: list[KeySequence]
+    ) -> ReportBatch:
         """
         Create key function reports for a keyboard sequence.
 
@@ -64,53 +281,52 @@ class LegacyProtocol:
             sequence: List of KeySequence tuples
 
         Returns:
-            List of reports to send
+            Batch of reports to send
         """
-        reports = []
-
-        # Add layer selection if needed
-        if self.report_id != 0:
-            reports.append(self.create_layer_selection_report(layer))
-
         # If empty sequence, send None key
         if not sequence:
-            sequence = [KeySequence(KeyCode.NONE, Modifier.NONE)]
+            sequence = _EMPTY_SEQUENCE
+
+        # One initial report plus one per key (after layer selection if needed)
+        seq_len = len(sequence)
+        batch, base, type_index = self._begin(seq_len + 1, layer)
+        buf = batch.buf
+        stride = batch.stride
+
+        # Loop invariants
+        action_val = int(action)
+        type_byte = _TYPE_BYTE_LUT[_KT_BASIC][type_index]
+        pack_header = _KEY_HEADER.pack_into
 
         # Create key function reports
         # Each key in sequence needs its own report, plus one initial report
-        for index in range(len(sequence) + 1):
-            report = Report(self.report_id)
-
-            report.data[0] = action.value  # Button/knob action
-            report.data[1] = KeyType.BASIC  # Key type
-            if self.report_id != 0:
-                report.data[1] |= (layer << 4) & 0xFF
-            report.data[2] = len(sequence)  # Total sequence length
-            report.data[3] = index  # Current index
-
-            if index == 0:
-                # First report: Send first key's modifiers
-                report.data[4] = int(sequence[0].modifiers)
-                report.data[5] = 0
-            else:
-                # Subsequent reports: Send actual keys
-                key_seq = sequence[index - 1]
-                report.data[4] = int(key_seq.modifiers)
-                report.data[5] = int(key_seq.key)
-
-            reports.append(report)
+        try:
+            for index in range(seq_len + 1):
+                if index == 0:
+                    # First report: Send first key's modifiers
+                    mod, key = int(sequence[0].modifiers), 0
+                else:
+                    # Subsequent reports: Send actual keys
+                    key_seq = sequence[index - 1]
+                    mod, key = int(key_seq.modifiers), int(key_seq.key)
+
+                pack_header(buf, base + 1, action_val, type_byte, seq_len, index, mod, key)
+                base += stride
+        except struct.error:
+            batch.release()
+            raise _byte_range_error() from None
 
         # Add write flash command
-        reports.append(self.create_write_flash_report())
+        buf[base:base + FRAME_SIZE] = _write_flash_frame(self.report_id)
 
-        return reports
+        return batch
 
     def create_media_reports(
         self,
         action: InputAction,
         layer: int,
         media_key: MediaKey
-    ) -> List[Report]:
+    ) -> ReportBatch:
         """
         Create media key function reports.
 
@@ -120,33 +336,15 @@ class LegacyProtocol:
             media_key: Media key to assign
 
         Returns:
-            List of reports to send
+            Batch of reports to send
         """
-        reports = []
-
-        # Add layer selection if needed
-        if self.report_id != 0:
-            reports.append(self.create_layer_selection_report(layer))
-
-        # Create media key report
-        report = Report(self.report_id)
-        report.data[0] = action.value
-        report.data[1] = KeyType.MULTIMEDIA
-        if self.report_id != 0:
-            report.data[1] |= (layer << 4) & 0xFF
-
         # Media key encoding (simplified for protocol 0)
-        if self.report_id == 0:
-            report.data[2] = media_key.value & 0xFF
-            report.data[3] = 0
-        else:
-            report.data[2] = media_key.value & 0xFF
-            report.data[3] = (media_key.value >> 8) & 0xFF
+        media_val = int(media_key)
+        high = (media_val >> 8) & 0xFF if self.report_id != 0 else 0
 
-        reports.append(report)
-        reports.append(self.create_write_flash_report())
-
-        return reports
+        return self._create_function_reports(
+            action, layer, _KT_MULTI, media_val & 0xFF, high
+        )
 
     def create_mouse_reports(
         self,
@@ -154,7 +352,7 @@ class LegacyProtocol:
         layer: int,
         button: MouseButton,
         modifiers: Modifier
-    ) -> List[Report]:
+    ) -> ReportBatch:
         """
         Create mouse button function reports.
 
@@ -165,41 +363,23 @@ class LegacyProtocol:
             modifiers: Modifier keys
 
         Returns:
-            List of reports to send
+            Batch of reports to send
         """
-        reports = []
-
-        # Add layer selection if needed
-        if self.report_id != 0:
-            reports.append(self.create_layer_selection_report(layer))
-
-        # Create mouse function report
-        report = Report(self.report_id)
-        report.data[0] = action.value
-        report.data[1] = KeyType.MULTIMEDIA
-        if self.report_id != 0:
-            report.data[1] |= (layer << 4) & 0xFF
-
         # Mouse button encoding
-        if button in (MouseButton.LEFT, MouseButton.RIGHT, MouseButton.MIDDLE):
-            report.data[2] = button.value
-            report.data[3] = 0
+        if button in _MOUSE_CLICK_BUTTONS:
+            b2, b3 = int(button), 0
         else:  # Scroll
-            report.data[2] = 0
-            report.data[3] = button.value
-
-        report.data[4] = int(modifiers)
+            b2, b3 = 0, int(button)
 
-        reports.append(report)
-        reports.append(self.create_write_flash_report())
-
-        return reports
+        return self._create_function_reports(
+            action, layer, _KT_MULTI, b2, b3, int(modifiers)
+        )
 
     def create_led_reports(
         self,
         layer: int,
         mode: LedMode
-    ) -> List[Report]:
+    ) -> ReportBatch:
         """
         Create LED mode reports.
 
@@ -208,19 +388,23 @@ class LegacyProtocol:
             mode: LED mode
 
         Returns:
-            List of reports to send
+            Batch of reports to send (empty if the mode is unsupported)
         """
         # For protocol 0, only modes 0-2 are supported
-        if self.report_id == 0 and mode.value > 2:
-            logger.warning(f"LED mode {mode} not supported on protocol 0")
-            return []
+        mode_val = int(mode)
+        if self.report_id == 0 and mode_val > 2:
+            logger.warning("LED mode %s not supported on protocol 0", mode)
+            return ReportBatch(0)
+
+        batch = ReportBatch(2, self.report_id)
+        buf = batch.buf
+        buf[1] = 0xB0  # LED function command
+        buf[2] = mode_val
+        buf[3] = 0  # Color (not supported on 3-button 1-knob)
 
-        report = Report(self.report_id)
-        report.data[0] = 0xB0  # LED function command
-        report.data[1] = mode.value
-        report.data[2] = 0  # Color (not supported on 3-button 1-knob)
+        buf[batch.stride:] = _write_flash_frame(self.report_id, led=True)
 
-        return [report, self.create_write_flash_report(led=True)]
+        return batch
 
 
 class ExtendedProtocol:
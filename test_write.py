@@ -65,15 +65,13 @@ try:
     # Try a simple write test
     print("=== Testing write operation ===\n")
 
-    # Create a test report (LED off command)
+    # Create a test report (LED off command): [report_id][64 data bytes]
     report_id = 0
-    test_data = bytearray(64)
-    test_data[0] = 0xB0  # LED command
-    test_data[1] = 0x00  # OFF mode
-
     buffer = bytearray(65)
     buffer[0] = report_id
-    buffer[1:65] = test_data
+    buffer[1] = 0xB0  # LED command
+    buffer[2] = 0x00  # OFF mode
+    test_data = memoryview(buffer)[1:]
 
     print(f"Report ID: {report_id}")
     print(f"Data (first 10 bytes): {' '.join(f'{b:02X}' for b in test_data[:10])}")
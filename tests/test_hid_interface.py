@@ -0,0 +1,100 @@
+"""Hot-plug scenarios for device enumeration, against an in-memory hid module."""
+
+import sys
+import types
+import unittest
+from unittest import mock
+
+from macropad import hid_interface
+from macropad.device import MacroPadDevice
+from macropad.hid_interface import HidInterface
+
+
+def _device_info(path: bytes) -> dict:
+    """Enumeration entry for the 3-button 1-knob device at ``path``."""
+    return {
+        'vendor_id': 0x1189,
+        'product_id': 0x8890,
+        'path': path,
+        'manufacturer_string': 'Test',
+        'product_string': 'MacroPad',
+    }
+
+
+class FakeHid(types.ModuleType):
+    """Minimal hid module whose plugged-in devices can be changed."""
+
+    def __init__(self):
+        super().__init__('hid')
+        self.plugged = []
+        fake = self
+
+        class device:
+            def open_path(self, path):
+                if path not in [d['path'] for d in fake.plugged]:
+                    raise OSError("open failed")
+
+            def get_manufacturer_string(self):
+                return 'Test'
+
+            def get_product_string(self):
+                return 'MacroPad'
+
+            def close(self):
+                pass
+
+        self.device = device
+
+    def enumerate(self, vendor_id=0, product_id=0):
+        return [dict(d) for d in self.plugged]
+
+
+class HotPlugTest(unittest.TestCase):
+
+    def setUp(self):
+        self.hid = FakeHid()
+        patcher = mock.patch.dict(sys.modules, {'hid': self.hid})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        hid_interface._enumerate.cache_clear()
+        self.addCleanup(hid_interface._enumerate.cache_clear)
+
+    def test_connect_after_plugging_in(self):
+        device = MacroPadDevice()
+        self.assertFalse(device.connect())
+
+        self.hid.plugged.append(_device_info(b'old&MI_01'))
+        self.assertTrue(device.connect())
+
+    def test_list_sees_unplug_and_new_devices(self):
+        self.hid.plugged.append(_device_info(b'first&MI_01'))
+        self.assertEqual(len(HidInterface.list_devices()), 1)
+
+        self.hid.plugged.append(_device_info(b'second&MI_01'))
+        self.assertEqual(len(MacroPadDevice.list_devices()), 2)
+
+        self.hid.plugged.clear()
+        self.assertEqual(HidInterface.list_devices(), [])
+
+    def test_list_replug_connect(self):
+        self.hid.plugged.append(_device_info(b'old&MI_01'))
+        self.assertEqual(len(HidInterface.list_devices()), 1)
+
+        # Re-plugged under a new path after the listing
+        self.hid.plugged[:] = [_device_info(b'new&MI_01')]
+
+        device = MacroPadDevice()
+        self.assertTrue(device.connect())
+
+    def test_list_then_connect_reuses_enumeration(self):
+        self.hid.plugged.append(_device_info(b'old&MI_01'))
+        HidInterface.list_devices()
+
+        with mock.patch.object(self.hid, 'enumerate', wraps=self.hid.enumerate) as enumerate_:
+            self.assertTrue(MacroPadDevice().connect())
+            enumerate_.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()